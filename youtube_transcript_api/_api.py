@@ -16,7 +16,7 @@ from ._errors import CookiePathInvalid, CookiesInvalid
 
 class YouTubeTranscriptApi(object):
     @classmethod
-    def list_transcripts(cls, video_id, proxies=None, cookies=None):
+    def list_transcripts(cls, video_id, proxies=None, cookies=None, http_client=None):
         """
         Retrieves the list of transcripts which are available for a given video. It returns a `TranscriptList` object
         which is iterable and provides methods to filter the list of transcripts for specific languages. While iterating
@@ -61,14 +61,19 @@ class YouTubeTranscriptApi(object):
         :type proxies: {'http': str, 'https': str} - http://docs.python-requests.org/en/master/user/advanced/#proxies
         :param cookies: a string of the path to a text file containing youtube authorization cookies
         :type cookies: str
+        :param http_client: a session which will be used for the network requests instead of creating a new one. This
+        allows connections to YouTube to be kept alive across multiple calls. The given cookies and proxies, as well as
+        the consent cookie if YouTube requires one, are added to this session.
+        :type http_client: requests.Session
         :return: the list of available transcripts
         :rtype TranscriptList:
         """
-        with requests.Session() as http_client:
-            if cookies:
-                http_client.cookies = cls._load_cookies(cookies, video_id)
-            http_client.proxies = proxies if proxies else {}
-            return TranscriptListFetcher(http_client).fetch(video_id)
+        if http_client is None:
+            with requests.Session() as http_client:
+                return cls._fetch_transcript_list(
+                    http_client, video_id, proxies, cookies
+                )
+        return cls._fetch_transcript_list(http_client, video_id, proxies, cookies)
 
     @classmethod
     def get_transcripts(
@@ -79,9 +84,12 @@ class YouTubeTranscriptApi(object):
         proxies=None,
         cookies=None,
         preserve_formatting=False,
+        http_client=None,
     ):
         """
-        Retrieves the transcripts for a list of videos.
+        Retrieves the transcripts for a list of videos. All videos are fetched using the same session, so that
+        connections to YouTube can be reused. Video ids which occur multiple times are only fetched once, so they will
+        also only show up once in the list of video ids which could not be retrieved.
 
         :param video_ids: a list of youtube video ids
         :type video_ids: list[str]
@@ -98,19 +106,39 @@ class YouTubeTranscriptApi(object):
         :type cookies: str
         :param preserve_formatting: whether to keep select HTML text formatting
         :type preserve_formatting: bool
+        :param http_client: a session which will be used for the network requests instead of creating a new one. The
+        given cookies and proxies, as well as the consent cookie if YouTube requires one, are added to this session.
+        :type http_client: requests.Session
         :return: a tuple containing a dictionary mapping video ids onto their corresponding transcripts, and a list of
         video ids, which could not be retrieved
         :rtype ({str: [{'text': str, 'start': float, 'end': float}]}, [str]}):
         """
         assert isinstance(video_ids, list), "`video_ids` must be a list of strings"
 
+        if http_client is None:
+            with requests.Session() as http_client:
+                return cls.get_transcripts(
+                    video_ids,
+                    languages,
+                    continue_after_error,
+                    proxies,
+                    cookies,
+                    preserve_formatting,
+                    http_client,
+                )
+
         data = {}
         unretrievable_videos = []
 
-        for video_id in video_ids:
+        for video_id in dict.fromkeys(video_ids):
             try:
                 data[video_id] = cls.get_transcript(
-                    video_id, languages, proxies, cookies, preserve_formatting
+                    video_id,
+                    languages,
+                    proxies,
+                    cookies,
+                    preserve_formatting,
+                    http_client=http_client,
                 )
             except Exception as exception:
                 if not continue_after_error:
@@ -128,6 +156,7 @@ class YouTubeTranscriptApi(object):
         proxies=None,
         cookies=None,
         preserve_formatting=False,
+        http_client=None,
     ):
         """
         Retrieves the transcript for a single video. This is just a shortcut for calling::
@@ -146,16 +175,37 @@ class YouTubeTranscriptApi(object):
         :type cookies: str
         :param preserve_formatting: whether to keep select HTML text formatting
         :type preserve_formatting: bool
+        :param http_client: a session which will be used for the network requests instead of creating a new one. The
+        given cookies and proxies, as well as the consent cookie if YouTube requires one, are added to this session.
+        :type http_client: requests.Session
         :return: a list of dictionaries containing the 'text', 'start' and 'duration' keys
         :rtype [{'text': str, 'start': float, 'end': float}]:
         """
         assert isinstance(video_id, str), "`video_id` must be a string"
+        if http_client is None:
+            with requests.Session() as http_client:
+                return cls.get_transcript(
+                    video_id,
+                    languages,
+                    proxies,
+                    cookies,
+                    preserve_formatting,
+                    http_client,
+                )
         return (
-            cls.list_transcripts(video_id, proxies, cookies)
+            cls._fetch_transcript_list(http_client, video_id, proxies, cookies)
             .find_transcript(languages)
             .fetch(preserve_formatting=preserve_formatting)
         )
 
+    @classmethod
+    def _fetch_transcript_list(cls, http_client, video_id, proxies, cookies):
+        if cookies:
+            http_client.cookies.update(cls._load_cookies(cookies, video_id))
+        if proxies:
+            http_client.proxies.update(proxies)
+        return TranscriptListFetcher(http_client).fetch(video_id)
+
     @classmethod
     def _load_cookies(cls, cookies, video_id):
         try:
@@ -1,5 +1,7 @@
 import argparse
 
+from functools import lru_cache
+
 from ._api import YouTubeTranscriptApi
 
 from .formatters import FormatterLoader
@@ -70,6 +72,11 @@ class YouTubeTranscriptCli(object):
         return transcript.fetch()
 
     def _parse_args(self):
+        return self._sanitize_video_ids(self._build_parser().parse_args(self._args))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _build_parser():
         parser = argparse.ArgumentParser(
             description=(
                 "This is an python API which allows you to get the transcripts/subtitles for a given YouTube video. "
@@ -90,9 +97,7 @@ class YouTubeTranscriptCli(object):
         parser.add_argument(
             "--languages",
             nargs="*",
-            default=[
-                "en",
-            ],
+            default=("en",),
             type=str,
             help=(
                 'A list of language codes in a descending priority. For example, if this is set to "de en" it will '
@@ -119,7 +124,7 @@ class YouTubeTranscriptCli(object):
             "--format",
             type=str,
             default="pretty",
-            choices=tuple(FormatterLoader.TYPES.keys()),
+            choices=tuple(FormatterLoader.TYPES),
         )
         parser.add_argument(
             "--translate",
@@ -148,7 +153,7 @@ class YouTubeTranscriptCli(object):
             help="The cookie file that will be used for authorization with youtube.",
         )
 
-        return self._sanitize_video_ids(parser.parse_args(self._args))
+        return parser
 
     def _sanitize_video_ids(self, args):
         args.video_ids = [video_id.replace("\\", "") for video_id in args.video_ids]
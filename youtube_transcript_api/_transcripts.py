@@ -6,12 +6,16 @@ if sys.version_info.major == 2:  # pragma: no cover
     reload(sys)
     sys.setdefaultencoding("utf-8")
 
+import itertools
+
 import json
 
 from defusedxml import ElementTree
 
 import re
 
+from operator import itemgetter
+
 from requests import HTTPError
 
 from ._html_unescaping import unescape
@@ -29,6 +33,14 @@ from ._errors import (
 )
 from ._settings import WATCH_URL
 
+_WATCH_URL_PREFIX, _WATCH_URL_SUFFIX = WATCH_URL.split("{video_id}")
+
+_CONSENT_VALUE_REGEX = re.compile('name="v" value="(.*?)"')
+
+_get_caption_fields = itemgetter("languageCode", "baseUrl", "name")
+
+_TRANSCRIPT_CHUNK_SIZE = 16 * 1024
+
 
 def _raise_http_errors(response, video_id):
     try:
@@ -50,10 +62,10 @@ class TranscriptListFetcher(object):
         )
 
     def _extract_captions_json(self, html, video_id):
-        splitted_html = html.split('"captions":')
+        captions_start = html.find('"captions":')
 
-        if len(splitted_html) <= 1:
-            if video_id.startswith("http://") or video_id.startswith("https://"):
+        if captions_start == -1:
+            if video_id.startswith(("http://", "https://")):
                 raise InvalidVideoId(video_id)
             if 'class="g-recaptcha"' in html:
                 raise TooManyRequests(video_id)
@@ -62,8 +74,13 @@ class TranscriptListFetcher(object):
 
             raise TranscriptsDisabled(video_id)
 
+        captions_start += len('"captions":')
+        captions_end = html.find(',"videoDetails', captions_start)
+        if captions_end == -1:
+            captions_end = len(html)
+
         captions_json = json.loads(
-            splitted_html[1].split(',"videoDetails')[0].replace("\n", "")
+            html[captions_start:captions_end].replace("\n", "")
         ).get("playerCaptionsTracklistRenderer")
         if captions_json is None:
             raise TranscriptsDisabled(video_id)
@@ -74,7 +91,7 @@ class TranscriptListFetcher(object):
         return captions_json
 
     def _create_consent_cookie(self, html, video_id):
-        match = re.search('name="v" value="(.*?)"', html)
+        match = _CONSENT_VALUE_REGEX.search(html)
         if match is None:
             raise FailedToCreateConsentCookie(video_id)
         self._http_client.cookies.set(
@@ -92,9 +109,11 @@ class TranscriptListFetcher(object):
 
     def _fetch_html(self, video_id):
         response = self._http_client.get(
-            WATCH_URL.format(video_id=video_id), headers={"Accept-Language": "en-US"}
+            _WATCH_URL_PREFIX + video_id + _WATCH_URL_SUFFIX,
+            headers={"Accept-Language": "en-US"},
         )
-        return unescape(_raise_http_errors(response, video_id).text)
+        html = _raise_http_errors(response, video_id).text
+        return unescape(html) if "&" in html else html
 
 
 class TranscriptList(object):
@@ -126,6 +145,9 @@ class TranscriptList(object):
         self._manually_created_transcripts = manually_created_transcripts
         self._generated_transcripts = generated_transcripts
         self._translation_languages = translation_languages
+        # manually created transcripts take precedence over generated ones of the same language
+        self._transcripts = dict(generated_transcripts)
+        self._transcripts.update(manually_created_transcripts)
 
     @staticmethod
     def build(http_client, video_id, captions_json):
@@ -153,18 +175,21 @@ class TranscriptList(object):
         generated_transcripts = {}
 
         for caption in captions_json["captionTracks"]:
-            if caption.get("kind", "") == "asr":
+            language_code, url, name = _get_caption_fields(caption)
+            is_generated = caption.get("kind") == "asr"
+
+            if is_generated:
                 transcript_dict = generated_transcripts
             else:
                 transcript_dict = manually_created_transcripts
 
-            transcript_dict[caption["languageCode"]] = Transcript(
+            transcript_dict[language_code] = Transcript(
                 http_client,
                 video_id,
-                caption["baseUrl"],
-                caption["name"]["simpleText"],
-                caption["languageCode"],
-                caption.get("kind", "") == "asr",
+                url,
+                name["simpleText"],
+                language_code,
+                is_generated,
                 translation_languages if caption.get("isTranslatable", False) else [],
             )
 
@@ -176,9 +201,9 @@ class TranscriptList(object):
         )
 
     def __iter__(self):
-        return iter(
-            list(self._manually_created_transcripts.values())
-            + list(self._generated_transcripts.values())
+        return itertools.chain(
+            self._manually_created_transcripts.values(),
+            self._generated_transcripts.values(),
         )
 
     def find_transcript(self, language_codes):
@@ -195,10 +220,7 @@ class TranscriptList(object):
         :rtype Transcript:
         :raises: NoTranscriptFound
         """
-        return self._find_transcript(
-            language_codes,
-            [self._manually_created_transcripts, self._generated_transcripts],
-        )
+        return self._find_transcript(language_codes, self._transcripts)
 
     def find_generated_transcript(self, language_codes):
         """
@@ -212,7 +234,7 @@ class TranscriptList(object):
         :rtype Transcript:
         :raises: NoTranscriptFound
         """
-        return self._find_transcript(language_codes, [self._generated_transcripts])
+        return self._find_transcript(language_codes, self._generated_transcripts)
 
     def find_manually_created_transcript(self, language_codes):
         """
@@ -226,15 +248,12 @@ class TranscriptList(object):
         :rtype Transcript:
         :raises: NoTranscriptFound
         """
-        return self._find_transcript(
-            language_codes, [self._manually_created_transcripts]
-        )
+        return self._find_transcript(language_codes, self._manually_created_transcripts)
 
-    def _find_transcript(self, language_codes, transcript_dicts):
+    def _find_transcript(self, language_codes, transcripts):
         for language_code in language_codes:
-            for transcript_dict in transcript_dicts:
-                if language_code in transcript_dict:
-                    return transcript_dict[language_code]
+            if language_code in transcripts:
+                return transcripts[language_code]
 
         raise NoTranscriptFound(self.video_id, language_codes, self)
 
@@ -318,12 +337,13 @@ class Transcript(object):
         :return: a list of dictionaries containing the 'text', 'start' and 'duration' keys
         :rtype [{'text': str, 'start': float, 'end': float}]:
         """
-        response = self._http_client.get(
-            self._url, headers={"Accept-Language": "en-US"}
-        )
-        return _TranscriptParser(preserve_formatting=preserve_formatting).parse(
-            _raise_http_errors(response, self.video_id).text,
-        )
+        with self._http_client.get(
+            self._url, headers={"Accept-Language": "en-US"}, stream=True
+        ) as response:
+            _raise_http_errors(response, self.video_id)
+            return _TRANSCRIPT_PARSERS[bool(preserve_formatting)].parse(
+                _ChunkReader(response.iter_content(_TRANSCRIPT_CHUNK_SIZE))
+            )
 
     def __str__(self):
         return '{language_code} ("{language}"){translation_description}'.format(
@@ -356,39 +376,69 @@ class Transcript(object):
         )
 
 
-class _TranscriptParser(object):
-    _FORMATTING_TAGS = [
-        "strong",  # important
-        "em",  # emphasized
-        "b",  # bold
-        "i",  # italic
-        "mark",  # marked
-        "small",  # smaller
-        "del",  # deleted
-        "ins",  # inserted
-        "sub",  # subscript
-        "sup",  # superscript
-    ]
+_FORMATTING_TAGS = [
+    "strong",  # important
+    "em",  # emphasized
+    "b",  # bold
+    "i",  # italic
+    "mark",  # marked
+    "small",  # smaller
+    "del",  # deleted
+    "ins",  # inserted
+    "sub",  # subscript
+    "sup",  # superscript
+]
+
+_HTML_TAG_REGEX = re.compile(r"<[^>]*>")
+_HTML_TAG_REGEX_KEEP_FORMATTING = re.compile(
+    r"<\/?(?!\/?(" + "|".join(_FORMATTING_TAGS) + r")\b).*?\b>", re.IGNORECASE
+)
+
+
+class _ChunkReader(object):
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    def read(self, size=-1):
+        return next(self._chunks, b"")
 
+
+class _TranscriptParser(object):
     def __init__(self, preserve_formatting=False):
-        self._html_regex = self._get_html_regex(preserve_formatting)
-
-    def _get_html_regex(self, preserve_formatting):
-        if preserve_formatting:
-            formats_regex = "|".join(self._FORMATTING_TAGS)
-            formats_regex = r"<\/?(?!\/?(" + formats_regex + r")\b).*?\b>"
-            html_regex = re.compile(formats_regex, re.IGNORECASE)
-        else:
-            html_regex = re.compile(r"<[^>]*>", re.IGNORECASE)
-        return html_regex
-
-    def parse(self, plain_data):
-        return [
-            {
-                "text": re.sub(self._html_regex, "", unescape(xml_element.text)),
-                "start": float(xml_element.attrib["start"]),
-                "duration": float(xml_element.attrib.get("dur", "0.0")),
-            }
-            for xml_element in ElementTree.fromstring(plain_data)
-            if xml_element.text is not None
-        ]
+        self._clean_text = self._build_text_cleaner(
+            _HTML_TAG_REGEX_KEEP_FORMATTING if preserve_formatting else _HTML_TAG_REGEX
+        )
+
+    @staticmethod
+    def _build_text_cleaner(html_regex):
+        remove_html_tags = html_regex.sub
+
+        def clean_text(text):
+            if "&" in text:
+                text = unescape(text)
+            if "<" in text:
+                text = remove_html_tags("", text)
+            return text
+
+        return clean_text
+
+    def parse(self, xml_source):
+        clean_text = self._clean_text
+        snippets = []
+        for _, xml_element in ElementTree.iterparse(xml_source):
+            if xml_element.tag == "text" and xml_element.text is not None:
+                snippets.append(
+                    {
+                        "text": clean_text(xml_element.text),
+                        "start": float(xml_element.attrib["start"]),
+                        "duration": float(xml_element.attrib.get("dur", "0.0")),
+                    }
+                )
+            xml_element.clear()
+        return snippets
+
+
+_TRANSCRIPT_PARSERS = {
+    False: _TranscriptParser(preserve_formatting=False),
+    True: _TranscriptParser(preserve_formatting=True),
+}
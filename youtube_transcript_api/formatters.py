@@ -2,6 +2,10 @@ import json
 
 import pprint
 
+from operator import itemgetter
+
+_get_text = itemgetter("text")
+
 
 class Formatter(object):
     """Formatter should be used as an abstract base class.
@@ -72,7 +76,7 @@ class TextFormatter(Formatter):
         :return: all transcript text lines separated by newline breaks.'
         :rtype str
         """
-        return "\n".join(line["text"] for line in transcript)
+        return "\n".join(map(_get_text, transcript))
 
     def format_transcripts(self, transcripts, **kwargs):
         """Converts a list of transcripts into plain text with no timestamps.
@@ -82,7 +86,7 @@ class TextFormatter(Formatter):
         :rtype str
         """
         return "\n\n\n".join(
-            [self.format_transcript(transcript, **kwargs) for transcript in transcripts]
+            self.format_transcript(transcript, **kwargs) for transcript in transcripts
         )
 
 
@@ -118,11 +122,9 @@ class _TextBasedFormatter(TextFormatter):
         >>> self._seconds_to_timestamp(6.93)
         '00:00:06.930'
         """
-        time = float(time)
-        hours_float, remainder = divmod(time, 3600)
-        mins_float, secs_float = divmod(remainder, 60)
-        hours, mins, secs = int(hours_float), int(mins_float), int(secs_float)
-        ms = int(round((time - int(time)) * 1000, 2))
+        hours, remainder = divmod(int(round(time * 1000)), 3600000)
+        mins, remainder = divmod(remainder, 60000)
+        secs, ms = divmod(remainder, 1000)
         return self._format_timestamp(hours, mins, secs, ms)
 
     def format_transcript(self, transcript, **kwargs):
@@ -133,42 +135,44 @@ class _TextBasedFormatter(TextFormatter):
         https://www.w3.org/TR/webvtt1/#introduction-caption
         https://www.3playmedia.com/blog/create-srt-file/
         """
+        seconds_to_timestamp = self._seconds_to_timestamp
+        format_transcript_helper = self._format_transcript_helper
+        last_index = len(transcript) - 1
+
+        start_timestamps = [seconds_to_timestamp(line["start"]) for line in transcript]
         lines = []
         for i, line in enumerate(transcript):
             end = line["start"] + line["duration"]
-            time_text = "{} --> {}".format(
-                self._seconds_to_timestamp(line["start"]),
-                self._seconds_to_timestamp(
-                    transcript[i + 1]["start"]
-                    if i < len(transcript) - 1 and transcript[i + 1]["start"] < end
-                    else end
-                ),
-            )
-            lines.append(self._format_transcript_helper(i, time_text, line))
+            if i < last_index and transcript[i + 1]["start"] < end:
+                end_timestamp = start_timestamps[i + 1]
+            else:
+                end_timestamp = seconds_to_timestamp(end)
+            time_text = start_timestamps[i] + " --> " + end_timestamp
+            lines.append(format_transcript_helper(i, time_text, line))
 
         return self._format_transcript_header(lines)
 
 
 class SRTFormatter(_TextBasedFormatter):
     def _format_timestamp(self, hours, mins, secs, ms):
-        return "{:02d}:{:02d}:{:02d},{:03d}".format(hours, mins, secs, ms)
+        return "%02d:%02d:%02d,%03d" % (hours, mins, secs, ms)
 
     def _format_transcript_header(self, lines):
         return "\n\n".join(lines) + "\n"
 
     def _format_transcript_helper(self, i, time_text, line):
-        return "{}\n{}\n{}".format(i + 1, time_text, line["text"])
+        return "%d\n%s\n%s" % (i + 1, time_text, line["text"])
 
 
 class WebVTTFormatter(_TextBasedFormatter):
     def _format_timestamp(self, hours, mins, secs, ms):
-        return "{:02d}:{:02d}:{:02d}.{:03d}".format(hours, mins, secs, ms)
+        return "%02d:%02d:%02d.%03d" % (hours, mins, secs, ms)
 
     def _format_transcript_header(self, lines):
         return "WEBVTT\n\n" + "\n\n".join(lines) + "\n"
 
     def _format_transcript_helper(self, i, time_text, line):
-        return "{}\n{}".format(time_text, line["text"])
+        return time_text + "\n" + line["text"]
 
 
 class FormatterLoader(object):
@@ -186,7 +190,7 @@ class FormatterLoader(object):
                 "The format '{formatter_type}' is not supported. "
                 "Choose one of the following formats: {supported_formatter_types}".format(
                     formatter_type=formatter_type,
-                    supported_formatter_types=", ".join(FormatterLoader.TYPES.keys()),
+                    supported_formatter_types=", ".join(FormatterLoader.TYPES),
                 )
             )
 
@@ -197,6 +201,6 @@ class FormatterLoader(object):
         :param formatter_type:
         :return: Formatter object
         """
-        if formatter_type not in FormatterLoader.TYPES.keys():
+        if formatter_type not in FormatterLoader.TYPES:
             raise FormatterLoader.UnknownFormatterType(formatter_type)
         return FormatterLoader.TYPES[formatter_type]()
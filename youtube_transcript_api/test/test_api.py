@@ -1,8 +1,10 @@
 from unittest import TestCase
-from mock import patch
+from mock import patch, ANY, MagicMock
 
 import os
 
+from functools import lru_cache
+
 import requests
 
 import httpretty
@@ -24,18 +26,39 @@ from youtube_transcript_api import (
 )
 
 
-def load_asset(filename):
-    filepath = "{dirname}/assets/{filename}".format(
-        dirname=os.path.dirname(__file__), filename=filename
-    )
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
+
 
-    with open(filepath, mode="rb") as file:
+@lru_cache(maxsize=None)
+def load_asset(filename):
+    with open(os.path.join(ASSETS_DIR, filename), mode="rb") as file:
         return file.read()
 
 
 class TestYouTubeTranscriptApi(TestCase):
-    def setUp(self):
+    ref_transcript = [
+        {"text": "Hey, this is just a test", "start": 0.0, "duration": 1.54},
+        {
+            "text": "this is not the original transcript",
+            "start": 1.54,
+            "duration": 4.16,
+        },
+        {
+            "text": "just something shorter, I made up for testing",
+            "start": 5.7,
+            "duration": 3.239,
+        },
+    ]
+
+    @classmethod
+    def setUpClass(cls):
         httpretty.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        httpretty.disable()
+
+    def setUp(self):
         httpretty.register_uri(
             httpretty.GET,
             "https://www.youtube.com/watch",
@@ -49,26 +72,18 @@ class TestYouTubeTranscriptApi(TestCase):
 
     def tearDown(self):
         httpretty.reset()
-        httpretty.disable()
+
+    def assert_requested_language(self, language_code):
+        self.assertEqual(
+            httpretty.last_request().querystring.get("lang"), [language_code]
+        )
 
     def test_get_transcript(self):
         transcript = YouTubeTranscriptApi.get_transcript("GJLlxj_dtq8")
 
         self.assertEqual(
             transcript,
-            [
-                {"text": "Hey, this is just a test", "start": 0.0, "duration": 1.54},
-                {
-                    "text": "this is not the original transcript",
-                    "start": 1.54,
-                    "duration": 4.16,
-                },
-                {
-                    "text": "just something shorter, I made up for testing",
-                    "start": 5.7,
-                    "duration": 3.239,
-                },
-            ],
+            self.ref_transcript,
         )
 
     def test_get_transcript_formatted(self):
@@ -93,6 +108,67 @@ class TestYouTubeTranscriptApi(TestCase):
             ],
         )
 
+    def test_get_transcript__uses_one_session(self):
+        http_client = requests.Session()
+        session_calls = MagicMock()
+
+        with patch(
+            "youtube_transcript_api._api.requests.Session", return_value=http_client
+        ) as session_class, patch.object(
+            http_client, "get", wraps=http_client.get
+        ) as http_client_get, patch.object(
+            http_client, "close", wraps=http_client.close
+        ) as http_client_close:
+            session_calls.attach_mock(http_client_get, "get")
+            session_calls.attach_mock(http_client_close, "close")
+
+            transcript = YouTubeTranscriptApi.get_transcript("GJLlxj_dtq8")
+
+        self.assertEqual(transcript, self.ref_transcript)
+        session_class.assert_called_once_with()
+        self.assertEqual(
+            [name for name, _, _ in session_calls.mock_calls],
+            ["get", "get", "close"],
+        )
+        self.assertEqual(
+            [call.args[0].split("?")[0] for call in http_client_get.call_args_list],
+            [
+                "https://www.youtube.com/watch",
+                "https://www.youtube.com/api/timedtext",
+            ],
+        )
+
+    def test_get_transcript__response_body_already_read(self):
+        def read_body(response, *args, **kwargs):
+            response.content
+
+        with requests.Session() as http_client:
+            http_client.hooks["response"].append(read_body)
+
+            transcript = YouTubeTranscriptApi.get_transcript(
+                "GJLlxj_dtq8", http_client=http_client
+            )
+
+        self.assertEqual(transcript, self.ref_transcript)
+
+    def test_get_transcript__html_entities_are_unescaped(self):
+        httpretty.register_uri(
+            httpretty.GET,
+            "https://www.youtube.com/api/timedtext",
+            body=(
+                b'<?xml version="1.0" encoding="utf-8" ?><transcript>'
+                b'<text start="0" dur="1.54">it&amp;#39;s a &amp;quot;test&amp;quot;</text>'
+                b"</transcript>"
+            ),
+        )
+
+        transcript = YouTubeTranscriptApi.get_transcript("GJLlxj_dtq8")
+
+        self.assertEqual(
+            transcript,
+            [{"text": 'it\'s a "test"', "start": 0.0, "duration": 1.54}],
+        )
+
     def test_list_transcripts(self):
         transcript_list = YouTubeTranscriptApi.list_transcripts("GJLlxj_dtq8")
 
@@ -102,6 +178,50 @@ class TestYouTubeTranscriptApi(TestCase):
             language_codes, {"zh", "de", "en", "hi", "ja", "ko", "es", "cs", "en"}
         )
 
+    def test_list_transcripts__with_http_client(self):
+        with requests.Session() as http_client:
+            transcript_list = YouTubeTranscriptApi.list_transcripts(
+                "GJLlxj_dtq8", http_client=http_client
+            )
+
+            self.assertIs(
+                transcript_list.find_transcript(["en"])._http_client, http_client
+            )
+
+    def test_list_transcripts__http_client_keeps_its_proxies_and_cookies(self):
+        dirname, filename = os.path.split(os.path.abspath(__file__))
+        cookies = dirname + "/example_cookies.txt"
+        proxies = {"http": "http://localhost:8080"}
+
+        with requests.Session() as http_client:
+            http_client.proxies = dict(proxies)
+            http_client.cookies.set("SID", "TEST_SID", domain=".youtube.com")
+
+            YouTubeTranscriptApi.list_transcripts(
+                "GJLlxj_dtq8", cookies=cookies, http_client=http_client
+            )
+
+            self.assertEqual(http_client.proxies, proxies)
+            self.assertEqual(http_client.cookies.get("SID"), "TEST_SID")
+            self.assertEqual(http_client.cookies.get("TEST_FIELD"), "TEST_VALUE")
+
+    def test_list_transcripts__captions_at_end_of_page(self):
+        httpretty.register_uri(
+            httpretty.GET,
+            "https://www.youtube.com/watch",
+            body=(
+                '"captions":{"playerCaptionsTracklistRenderer":{"captionTracks":[{'
+                '"baseUrl":"https://www.youtube.com/api/timedtext?v=GJLlxj_dtq8\\u0026lang=en",'
+                '"name":{"simpleText":"English"},"languageCode":"en"}]}}'
+            ),
+        )
+
+        transcript_list = YouTubeTranscriptApi.list_transcripts("GJLlxj_dtq8")
+
+        self.assertEqual(
+            [transcript.language_code for transcript in transcript_list], ["en"]
+        )
+
     def test_list_transcripts__find_manually_created(self):
         transcript_list = YouTubeTranscriptApi.list_transcripts("GJLlxj_dtq8")
         transcript = transcript_list.find_manually_created_transcript(["cs"])
@@ -170,11 +290,8 @@ class TestYouTubeTranscriptApi(TestCase):
 
     def test_get_transcript__correct_language_is_used(self):
         YouTubeTranscriptApi.get_transcript("GJLlxj_dtq8", ["de", "en"])
-        query_string = httpretty.last_request().querystring
 
-        self.assertIn("lang", query_string)
-        self.assertEqual(len(query_string["lang"]), 1)
-        self.assertEqual(query_string["lang"][0], "de")
+        self.assert_requested_language("de")
 
     def test_get_transcript__fallback_language_is_used(self):
         httpretty.register_uri(
@@ -184,11 +301,8 @@ class TestYouTubeTranscriptApi(TestCase):
         )
 
         YouTubeTranscriptApi.get_transcript("F1xioXWb8CY", ["de", "en"])
-        query_string = httpretty.last_request().querystring
 
-        self.assertIn("lang", query_string)
-        self.assertEqual(len(query_string["lang"]), 1)
-        self.assertEqual(query_string["lang"][0], "en")
+        self.assert_requested_language("en")
 
     def test_get_transcript__create_consent_cookie_if_needed(self):
         httpretty.register_uri(
@@ -294,19 +408,7 @@ class TestYouTubeTranscriptApi(TestCase):
         transcript = YouTubeTranscriptApi.get_transcript("GJLlxj_dtq8", proxies=proxies)
         self.assertEqual(
             transcript,
-            [
-                {"text": "Hey, this is just a test", "start": 0.0, "duration": 1.54},
-                {
-                    "text": "this is not the original transcript",
-                    "start": 1.54,
-                    "duration": 4.16,
-                },
-                {
-                    "text": "just something shorter, I made up for testing",
-                    "start": 5.7,
-                    "duration": 3.239,
-                },
-            ],
+            self.ref_transcript,
         )
 
     def test_get_transcript__with_cookies(self):
@@ -316,19 +418,7 @@ class TestYouTubeTranscriptApi(TestCase):
 
         self.assertEqual(
             transcript,
-            [
-                {"text": "Hey, this is just a test", "start": 0.0, "duration": 1.54},
-                {
-                    "text": "this is not the original transcript",
-                    "start": 1.54,
-                    "duration": 4.16,
-                },
-                {
-                    "text": "just something shorter, I made up for testing",
-                    "start": 5.7,
-                    "duration": 3.239,
-                },
-            ],
+            self.ref_transcript,
         )
 
     def test_get_transcript__assertionerror_if_input_not_string(self):
@@ -349,9 +439,55 @@ class TestYouTubeTranscriptApi(TestCase):
             [video_id_1, video_id_2], languages=languages
         )
 
-        mock_get_transcript.assert_any_call(video_id_1, languages, None, None, False)
-        mock_get_transcript.assert_any_call(video_id_2, languages, None, None, False)
+        mock_get_transcript.assert_any_call(
+            video_id_1, languages, None, None, False, http_client=ANY
+        )
+        mock_get_transcript.assert_any_call(
+            video_id_2, languages, None, None, False, http_client=ANY
+        )
+        self.assertEqual(mock_get_transcript.call_count, 2)
+
+    @patch("youtube_transcript_api.YouTubeTranscriptApi.get_transcript")
+    def test_get_transcripts__duplicates_are_fetched_once(self, mock_get_transcript):
+        data, _ = YouTubeTranscriptApi.get_transcripts(
+            ["video_id_1", "video_id_2", "video_id_1"]
+        )
+
         self.assertEqual(mock_get_transcript.call_count, 2)
+        self.assertEqual(list(data), ["video_id_1", "video_id_2"])
+
+    @patch(
+        "youtube_transcript_api.YouTubeTranscriptApi.get_transcript",
+        side_effect=Exception("Error"),
+    )
+    def test_get_transcripts__failed_duplicates_are_listed_once(
+        self, mock_get_transcript
+    ):
+        _, unretrievable_videos = YouTubeTranscriptApi.get_transcripts(
+            ["video_id_1", "video_id_1"], continue_after_error=True
+        )
+
+        self.assertEqual(mock_get_transcript.call_count, 1)
+        self.assertEqual(unretrievable_videos, ["video_id_1"])
+
+    @patch("youtube_transcript_api.YouTubeTranscriptApi.get_transcript")
+    def test_get_transcripts__shares_http_client(self, mock_get_transcript):
+        YouTubeTranscriptApi.get_transcripts(["video_id_1", "video_id_2"])
+
+        http_clients = {
+            id(call.kwargs["http_client"])
+            for call in mock_get_transcript.call_args_list
+        }
+        self.assertEqual(len(http_clients), 1)
+
+    def test_get_transcripts__with_http_client(self):
+        with requests.Session() as http_client:
+            data, unretrievable_videos = YouTubeTranscriptApi.get_transcripts(
+                ["GJLlxj_dtq8"], http_client=http_client
+            )
+
+        self.assertEqual(len(data["GJLlxj_dtq8"]), 3)
+        self.assertEqual(unretrievable_videos, [])
 
     @patch(
         "youtube_transcript_api.YouTubeTranscriptApi.get_transcript",
@@ -373,15 +509,19 @@ class TestYouTubeTranscriptApi(TestCase):
             ["video_id_1", "video_id_2"], continue_after_error=True
         )
 
-        mock_get_transcript.assert_any_call(video_id_1, ("en",), None, None, False)
-        mock_get_transcript.assert_any_call(video_id_2, ("en",), None, None, False)
+        mock_get_transcript.assert_any_call(
+            video_id_1, ("en",), None, None, False, http_client=ANY
+        )
+        mock_get_transcript.assert_any_call(
+            video_id_2, ("en",), None, None, False, http_client=ANY
+        )
 
     @patch("youtube_transcript_api.YouTubeTranscriptApi.get_transcript")
     def test_get_transcripts__with_cookies(self, mock_get_transcript):
         cookies = "/example_cookies.txt"
         YouTubeTranscriptApi.get_transcripts(["GJLlxj_dtq8"], cookies=cookies)
         mock_get_transcript.assert_any_call(
-            "GJLlxj_dtq8", ("en",), None, cookies, False
+            "GJLlxj_dtq8", ("en",), None, cookies, False, http_client=ANY
         )
 
     @patch("youtube_transcript_api.YouTubeTranscriptApi.get_transcript")
@@ -389,7 +529,7 @@ class TestYouTubeTranscriptApi(TestCase):
         proxies = {"http": "", "https:": ""}
         YouTubeTranscriptApi.get_transcripts(["GJLlxj_dtq8"], proxies=proxies)
         mock_get_transcript.assert_any_call(
-            "GJLlxj_dtq8", ("en",), proxies, None, False
+            "GJLlxj_dtq8", ("en",), proxies, None, False, http_client=ANY
         )
 
     def test_load_cookies(self):
@@ -398,7 +538,7 @@ class TestYouTubeTranscriptApi(TestCase):
         session_cookies = YouTubeTranscriptApi._load_cookies(cookies, "GJLlxj_dtq8")
         self.assertEqual(
             {"TEST_FIELD": "TEST_VALUE"},
-            requests.utils.dict_from_cookiejar(session_cookies),
+            {cookie.name: cookie.value for cookie in session_cookies},
         )
 
     def test_load_cookies__bad_file_path(self):
@@ -1,5 +1,5 @@
 from unittest import TestCase
-from mock import MagicMock
+from mock import MagicMock, patch
 
 import json
 
@@ -38,9 +38,13 @@ class TestYouTubeTranscriptCli(TestCase):
             return_value=self.transcript_mock
         )
 
-        YouTubeTranscriptApi.list_transcripts = MagicMock(
-            return_value=self.transcript_list_mock
+        list_transcripts_patcher = patch.object(
+            YouTubeTranscriptApi,
+            "list_transcripts",
+            return_value=self.transcript_list_mock,
         )
+        list_transcripts_patcher.start()
+        self.addCleanup(list_transcripts_patcher.stop)
 
     def test_argument_parsing(self):
         parsed_args = YouTubeTranscriptCli(
@@ -103,13 +107,13 @@ class TestYouTubeTranscriptCli(TestCase):
         parsed_args = YouTubeTranscriptCli("v1 v2".split())._parse_args()
         self.assertEqual(parsed_args.video_ids, ["v1", "v2"])
         self.assertEqual(parsed_args.format, "pretty")
-        self.assertEqual(parsed_args.languages, ["en"])
+        self.assertEqual(parsed_args.languages, ("en",))
 
     def test_argument_parsing__video_ids_starting_with_dash(self):
         parsed_args = YouTubeTranscriptCli("\-v1 \-\-v2 \--v3".split())._parse_args()
         self.assertEqual(parsed_args.video_ids, ["-v1", "--v2", "--v3"])
         self.assertEqual(parsed_args.format, "pretty")
-        self.assertEqual(parsed_args.languages, ["en"])
+        self.assertEqual(parsed_args.languages, ("en",))
 
     def test_argument_parsing__fail_without_video_ids(self):
         with self.assertRaises(SystemExit):
@@ -119,12 +123,12 @@ class TestYouTubeTranscriptCli(TestCase):
         parsed_args = YouTubeTranscriptCli("v1 v2 --format json".split())._parse_args()
         self.assertEqual(parsed_args.video_ids, ["v1", "v2"])
         self.assertEqual(parsed_args.format, "json")
-        self.assertEqual(parsed_args.languages, ["en"])
+        self.assertEqual(parsed_args.languages, ("en",))
 
         parsed_args = YouTubeTranscriptCli("--format json v1 v2".split())._parse_args()
         self.assertEqual(parsed_args.video_ids, ["v1", "v2"])
         self.assertEqual(parsed_args.format, "json")
-        self.assertEqual(parsed_args.languages, ["en"])
+        self.assertEqual(parsed_args.languages, ("en",))
 
     def test_argument_parsing__languages(self):
         parsed_args = YouTubeTranscriptCli(
@@ -220,9 +224,7 @@ class TestYouTubeTranscriptCli(TestCase):
         self.transcript_list_mock.find_transcript.assert_any_call(["de", "en"])
 
     def test_run__failing_transcripts(self):
-        YouTubeTranscriptApi.list_transcripts = MagicMock(
-            side_effect=VideoUnavailable("video_id")
-        )
+        YouTubeTranscriptApi.list_transcripts.side_effect = VideoUnavailable("video_id")
 
         output = YouTubeTranscriptCli("v1 --languages de en".split()).run()
 
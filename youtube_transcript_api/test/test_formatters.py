@@ -16,13 +16,12 @@ from youtube_transcript_api.formatters import (
 
 
 class TestFormatters(TestCase):
-    def setUp(self):
-        self.transcript = [
-            {"text": "Test line 1", "start": 0.0, "duration": 1.50},
-            {"text": "line between", "start": 1.5, "duration": 2.0},
-            {"text": "testing the end line", "start": 2.5, "duration": 3.25},
-        ]
-        self.transcripts = [self.transcript, self.transcript]
+    transcript = [
+        {"text": "Test line 1", "start": 0.0, "duration": 1.50},
+        {"text": "line between", "start": 1.5, "duration": 2.0},
+        {"text": "testing the end line", "start": 2.5, "duration": 3.25},
+    ]
+    transcripts = [transcript, transcript]
 
     def test_base_formatter_format_call(self):
         with self.assertRaises(NotImplementedError):
@@ -55,6 +54,14 @@ class TestFormatters(TestCase):
         self.assertEqual(lines[-2], self.transcript[-1]["text"])
         self.assertEqual(lines[-1], "")
 
+    def test_srt_formatter_rounding_carries_over(self):
+        content = SRTFormatter().format_transcript(
+            [{"text": "Test line 1", "start": 59.9999999, "duration": 3600.0}]
+        )
+        lines = content.split("\n")
+
+        self.assertEqual(lines[1], "00:01:00,000 --> 01:01:00,000")
+
     def test_srt_formatter_many(self):
         formatter = SRTFormatter()
         content = formatter.format_transcripts(self.transcripts)